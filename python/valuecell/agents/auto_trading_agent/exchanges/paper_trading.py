@@ -2,6 +2,7 @@
 
 import logging
 import uuid
+from itertools import islice
 from typing import Any, Dict, List, Optional
 
 import yfinance as yf
@@ -254,15 +255,20 @@ class PaperTrading(ExchangeBase):
 
         Args:
             symbol: Optional symbol filter
-            limit: Max orders to return
+            limit: Max orders to return; zero or negative returns all orders
 
         Returns:
             Order history
         """
-        history = self.order_history
-        if symbol:
-            history = [o for o in history if o.symbol == symbol]
-        return history[-limit:]
+        if limit <= 0:
+            limit = len(self.order_history)
+        if not symbol:
+            return self.order_history[-limit:]
+        # Walk newest-first and stop as soon as `limit` matches are collected
+        matches = (o for o in reversed(self.order_history) if o.symbol == symbol)
+        recent = list(islice(matches, limit))
+        recent.reverse()
+        return recent
 
     # ============ Position Management ============
 
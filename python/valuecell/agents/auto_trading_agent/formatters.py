@@ -10,6 +10,15 @@ from .models import Position, TechnicalIndicators, TradeAction, TradeType
 
 logger = logging.getLogger(__name__)
 
+# Static labels reused by every market analysis notification
+_ACTION_EMOJI = {
+    TradeAction.BUY: "🟢",
+    TradeAction.SELL: "🔴",
+    TradeAction.HOLD: "⏸️",
+}
+_BULLISH_LABEL = "🟢 Bullish"
+_BEARISH_LABEL = "🔴 Bearish"
+
 
 class MessageFormatter:
     """Formats various messages and notifications"""
@@ -218,18 +227,11 @@ class MessageFormatter:
                 timestamp, format_str="%m/%d, %I:%M %p", include_tz=True
             )
 
-            # Format action with emoji
-            action_emoji = {
-                TradeAction.BUY: "🟢",
-                TradeAction.SELL: "🔴",
-                TradeAction.HOLD: "⏸️",
-            }
-
             message = (
                 f"📊 **Market Analysis - {symbol}**\n"
                 f"Time: {formatted_time}\n\n"
                 f"**Current Price:** ${indicators.close_price:,.2f}\n"
-                f"**Decision:** {action_emoji.get(action, '')} {action.value.upper()}"
+                f"**Decision:** {_ACTION_EMOJI.get(action, '')} {action.value.upper()}"
             )
 
             if action != TradeAction.HOLD:
@@ -240,9 +242,9 @@ class MessageFormatter:
             # Add MACD
             if indicators.macd is not None and indicators.macd_signal is not None:
                 macd_signal = (
-                    "🟢 Bullish"
+                    _BULLISH_LABEL
                     if indicators.macd > indicators.macd_signal
-                    else "🔴 Bearish"
+                    else _BEARISH_LABEL
                 )
                 message += f"- MACD: {indicators.macd:.4f} / Signal: {indicators.macd_signal:.4f} ({macd_signal})\n"
 
@@ -258,9 +260,9 @@ class MessageFormatter:
             # Add EMAs
             if indicators.ema_12 is not None and indicators.ema_26 is not None:
                 ema_signal = (
-                    "🟢 Bullish"
+                    _BULLISH_LABEL
                     if indicators.ema_12 > indicators.ema_26
-                    else "🔴 Bearish"
+                    else _BEARISH_LABEL
                 )
                 message += f"- EMA 12/26: ${indicators.ema_12:,.2f} / ${indicators.ema_26:,.2f} ({ema_signal})\n"
 
@@ -0,0 +1,34 @@
+import pytest
+
+from valuecell.agents.auto_trading_agent.exchanges.base_exchange import Order
+from valuecell.agents.auto_trading_agent.exchanges.paper_trading import PaperTrading
+
+
+def _exchange_with_history() -> PaperTrading:
+    exchange = PaperTrading()
+    for i, symbol in enumerate(["BTCUSDT", "ETHUSDT", "BTCUSDT", "BTCUSDT"]):
+        exchange.order_history.append(
+            Order(order_id=f"o{i}", symbol=symbol, side="buy", quantity=1, price=1)
+        )
+    return exchange
+
+
+@pytest.mark.asyncio
+async def test_get_order_history_filtered_returns_latest_matches():
+    exchange = _exchange_with_history()
+
+    orders = await exchange.get_order_history(symbol="BTCUSDT", limit=2)
+
+    assert [o.order_id for o in orders] == ["o2", "o3"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_get_order_history_non_positive_limit_returns_all(limit):
+    exchange = _exchange_with_history()
+
+    all_orders = await exchange.get_order_history(limit=limit)
+    btc_orders = await exchange.get_order_history(symbol="BTCUSDT", limit=limit)
+
+    assert [o.order_id for o in all_orders] == ["o0", "o1", "o2", "o3"]
+    assert [o.order_id for o in btc_orders] == ["o0", "o2", "o3"]
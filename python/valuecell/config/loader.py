@@ -28,7 +28,7 @@ import logging
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
@@ -36,6 +36,18 @@ from .constants import CONFIG_DIR
 
 logger = logging.getLogger(__name__)
 
+# Pattern: ${VAR_NAME} or ${VAR_NAME:default_value}
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}:]+)(?::([^}]*))?\}")
+
+
+def _replace_env_var(match: re.Match) -> str:
+    """Substitute a single ${VAR_NAME[:default]} match from the environment."""
+    var_name = match.group(1)
+    default_value = match.group(2) if match.group(2) is not None else ""
+    resolved = os.getenv(var_name, default_value)
+    logger.debug(f"Resolved ${{{var_name}}} -> {resolved}")
+    return resolved
+
 
 class ConfigLoader:
     """
@@ -60,7 +72,8 @@ class ConfigLoader:
             logger.error(f"Config directory not found: {self.config_dir}")
 
         self.environment = os.getenv("APP_ENVIRONMENT", "development")
-        self._cache: Dict[str, Any] = {}
+        # (kind, name[, environment]) -> loaded config
+        self._cache: Dict[Tuple[str, ...], Any] = {}
 
         logger.debug(
             f"ConfigLoader initialized: config_dir={self.config_dir}, env={self.environment}"
@@ -81,17 +94,10 @@ class ConfigLoader:
             Value with environment variables resolved
         """
         if isinstance(value, str):
-            # Pattern: ${VAR_NAME} or ${VAR_NAME:default_value}
-            pattern = r"\$\{([^}:]+)(?::([^}]*))?\}"
-
-            def replacer(match):
-                var_name = match.group(1)
-                default_value = match.group(2) if match.group(2) is not None else ""
-                resolved = os.getenv(var_name, default_value)
-                logger.debug(f"Resolved ${{{var_name}}} -> {resolved}")
-                return resolved
-
-            return re.sub(pattern, replacer, value)
+            # Most values contain no placeholder; skip the regex scan entirely
+            if "${" not in value:
+                return value
+            return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
 
         elif isinstance(value, dict):
             return {k: self._resolve_env_vars(v) for k, v in value.items()}
@@ -221,7 +227,7 @@ class ConfigLoader:
         Returns:
             Merged configuration dictionary
         """
-        cache_key = f"{config_name}_{self.environment}"
+        cache_key = ("config", config_name, self.environment)
 
         if cache_key in self._cache:
             return self._cache[cache_key]
@@ -261,7 +267,7 @@ class ConfigLoader:
         Returns:
             Provider configuration with environment overrides
         """
-        cache_key = f"provider_{provider_name}"
+        cache_key = ("provider", provider_name)
 
         if cache_key in self._cache:
             return self._cache[cache_key]
@@ -303,7 +309,7 @@ class ConfigLoader:
         Returns:
             Agent configuration with all overrides applied
         """
-        cache_key = f"agent_{agent_name}"
+        cache_key = ("agent", agent_name)
 
         if cache_key in self._cache:
             return self._cache[cache_key]
@@ -341,7 +347,7 @@ class ConfigLoader:
         Returns:
             Integration configuration with overrides applied
         """
-        cache_key = f"third_party_{integration_name}"
+        cache_key = ("third_party", integration_name)
 
         if cache_key in self._cache:
             return self._cache[cache_key]
@@ -1,13 +1,41 @@
 import asyncio
+import os
 import sqlite3
+import time
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import aiosqlite
 
 from .models import Conversation
 
+# Max conversations kept in memory per database file by SQLiteConversationStore
+DEFAULT_CONVERSATION_CACHE_SIZE = 1024
+# How long a cached conversation is trusted before it is re-read, bounding
+# staleness from writers outside this process
+DEFAULT_CONVERSATION_CACHE_TTL_SECONDS = 60.0
+
+# Conversation caches keyed by resolved database path. Shared by every store
+# opened on the same file so a save or delete through one store is seen by the
+# others; a cache is dropped once no store references it. Values are
+# (cached_at, conversation).
+_ConversationCache = OrderedDict[str, Tuple[float, Conversation]]
+_conversation_caches: "weakref.WeakValueDictionary[str, _ConversationCache]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _shared_cache(db_path: str) -> _ConversationCache:
+    key = db_path if db_path == ":memory:" else os.path.realpath(db_path)
+    cache = _conversation_caches.get(key)
+    if cache is None:
+        cache = OrderedDict()
+        _conversation_caches[key] = cache
+    return cache
+
 
 class ConversationStore(ABC):
     """Conversation storage abstract base class - handles conversation metadata only.
@@ -39,6 +67,19 @@ class ConversationStore(ABC):
     async def conversation_exists(self, conversation_id: str) -> bool:
         """Check if conversation exists"""
 
+    async def touch_conversation(
+        self, conversation_id: str, updated_at: datetime
+    ) -> None:
+        """Set only the conversation's last activity timestamp.
+
+        The default re-saves the whole conversation; stores that can update a
+        single column should override it.
+        """
+        conversation = await self.load_conversation(conversation_id)
+        if conversation is not None:
+            conversation.updated_at = updated_at
+            await self.save_conversation(conversation)
+
 
 class InMemoryConversationStore(ConversationStore):
     """In-memory ConversationStore implementation used for testing and simple scenarios.
@@ -91,6 +132,14 @@ class InMemoryConversationStore(ConversationStore):
         """Check if conversation exists"""
         return conversation_id in self._conversations
 
+    async def touch_conversation(
+        self, conversation_id: str, updated_at: datetime
+    ) -> None:
+        """Set the conversation's last activity timestamp in place"""
+        conversation = self._conversations.get(conversation_id)
+        if conversation is not None:
+            conversation.updated_at = updated_at
+
     def clear_all(self) -> None:
         """Clear all conversations (for testing)"""
         self._conversations.clear()
@@ -105,13 +154,26 @@ class SQLiteConversationStore(ConversationStore):
 
     Lazily initializes the database schema on first use. Uses aiosqlite to
     perform non-blocking DB operations and converts rows to Conversation
-    instances.
+    instances. Recently used conversations are kept in an in-process LRU
+    cache with a short TTL that is updated on save and evicted on delete,
+    so repeated loads of an active conversation do not hit the database.
+    Pass `use_cache=False` to always read from the database.
     """
 
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        use_cache: bool = True,
+        cache_size: int = DEFAULT_CONVERSATION_CACHE_SIZE,
+        cache_ttl: float = DEFAULT_CONVERSATION_CACHE_TTL_SECONDS,
+    ):
         self.db_path = db_path
         self._initialized = False
         self._init_lock = None  # lazy to avoid loop-binding in __init__
+        self._use_cache = use_cache and cache_size > 0
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._cache = _shared_cache(db_path)
 
     async def _ensure_initialized(self):
         """Ensure database is initialized with proper schema."""
@@ -139,6 +201,12 @@ class SQLiteConversationStore(ConversationStore):
                     )
                     """
                 )
+                await db.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_conv_user_time
+                    ON conversations (user_id, created_at);
+                    """
+                )
                 await db.commit()
 
             self._initialized = True
@@ -156,6 +224,43 @@ class SQLiteConversationStore(ConversationStore):
             status=row["status"],
         )
 
+    def _cache_get(self, conversation_id: str) -> Optional[Conversation]:
+        if not self._use_cache:
+            return None
+        cached = self._cache.get(conversation_id)
+        if cached is None:
+            return None
+        cached_at, conversation = cached
+        if time.monotonic() - cached_at >= self._cache_ttl:
+            del self._cache[conversation_id]
+            return None
+        self._cache.move_to_end(conversation_id)
+        # Hand out copies so callers can't mutate the cached instance
+        return conversation.model_copy()
+
+    def _cache_put(self, conversation: Conversation, loaded: bool = False) -> None:
+        """Cache a conversation copy.
+
+        `loaded` marks rows read from the database; those never replace a
+        cached copy that is at least as new, since a save may have landed
+        while the read was in flight.
+        """
+        if not self._use_cache:
+            # Keep caching stores on the same file from serving the old copy
+            self._cache.pop(conversation.conversation_id, None)
+            return
+        if loaded:
+            cached = self._cache.get(conversation.conversation_id)
+            if cached is not None and cached[1].updated_at >= conversation.updated_at:
+                return
+        self._cache[conversation.conversation_id] = (
+            time.monotonic(),
+            conversation.model_copy(),
+        )
+        self._cache.move_to_end(conversation.conversation_id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
     async def save_conversation(self, conversation: Conversation) -> None:
         """Save conversation to SQLite database."""
         await self._ensure_initialized()
@@ -179,9 +284,33 @@ class SQLiteConversationStore(ConversationStore):
                 ),
             )
             await db.commit()
+        self._cache_put(conversation)
+
+    async def touch_conversation(
+        self, conversation_id: str, updated_at: datetime
+    ) -> None:
+        """Update only updated_at, leaving concurrently changed fields intact."""
+        await self._ensure_initialized()
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute(
+                "UPDATE conversations SET updated_at = ? WHERE conversation_id = ?",
+                (updated_at.isoformat(), conversation_id),
+            )
+            await db.commit()
+        cached = self._cache.get(conversation_id)
+        if cached is not None:
+            cached_at, conversation = cached
+            self._cache[conversation_id] = (
+                cached_at,
+                conversation.model_copy(update={"updated_at": updated_at}),
+            )
 
     async def load_conversation(self, conversation_id: str) -> Optional[Conversation]:
         """Load conversation from SQLite database."""
+        cached = self._cache_get(conversation_id)
+        if cached is not None:
+            return cached
+
         await self._ensure_initialized()
         async with aiosqlite.connect(self.db_path) as db:
             db.row_factory = sqlite3.Row
@@ -190,7 +319,11 @@ class SQLiteConversationStore(ConversationStore):
                 (conversation_id,),
             )
             row = await cur.fetchone()
-            return self._row_to_conversation(row) if row else None
+        if not row:
+            return None
+        conversation = self._row_to_conversation(row)
+        self._cache_put(conversation, loaded=True)
+        return conversation
 
     async def delete_conversation(self, conversation_id: str) -> bool:
         """Delete conversation from SQLite database."""
@@ -201,7 +334,8 @@ class SQLiteConversationStore(ConversationStore):
                 (conversation_id,),
             )
             await db.commit()
-            return cur.rowcount > 0
+        self._cache.pop(conversation_id, None)
+        return cur.rowcount > 0
 
     async def list_conversations(
         self, user_id: Optional[str] = None, limit: int = 100, offset: int = 0
@@ -229,6 +363,8 @@ class SQLiteConversationStore(ConversationStore):
 
     async def conversation_exists(self, conversation_id: str) -> bool:
         """Check if conversation exists in SQLite database."""
+        if self._cache_get(conversation_id) is not None:
+            return True
         await self._ensure_initialized()
         async with aiosqlite.connect(self.db_path) as db:
             cur = await db.execute(
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import sqlite3
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
 import aiosqlite
 
@@ -27,6 +27,8 @@ class ItemStore(ABC):
         limit: Optional[int] = None,
         offset: int = 0,
         role: Optional[Role] = None,
+        descending: bool = False,
+        conversation_ids: Optional[Sequence[str]] = None,
         **kwargs,
     ) -> List[ConversationItem]: ...
 
@@ -65,10 +67,16 @@ class InMemoryItemStore(ItemStore):
         limit: Optional[int] = None,
         offset: int = 0,
         role: Optional[Role] = None,
+        descending: bool = False,
+        conversation_ids: Optional[Sequence[str]] = None,
         **kwargs,
     ) -> List[ConversationItem]:
         if conversation_id is not None:
             items = list(self._items.get(conversation_id, []))
+        elif conversation_ids is not None:
+            items = []
+            for conv_id in conversation_ids:
+                items.extend(self._items.get(conv_id, []))
         else:
             # Collect all items from all conversations
             items = []
@@ -76,6 +84,8 @@ class InMemoryItemStore(ItemStore):
                 items.extend(conv_items)
         if role is not None:
             items = [m for m in items if m.role == role]
+        if descending:
+            items.reverse()
         if offset:
             items = items[offset:]
         if limit is not None:
@@ -163,8 +173,9 @@ class SQLiteItemStore(ItemStore):
 
     async def save_item(self, item: ConversationItem) -> None:
         await self._ensure_initialized()
-        role_val = getattr(item.role, "value", str(item.role))
-        event_val = getattr(item.event, "value", str(item.event))
+        # ConversationItem validates role/event into enums, so .value is safe
+        role_val = item.role.value
+        event_val = item.event.value
         async with aiosqlite.connect(self.db_path) as db:
             await db.execute(
                 """
@@ -195,14 +206,22 @@ class SQLiteItemStore(ItemStore):
         component_type: Optional[str] = None,
         limit: Optional[int] = None,
         offset: int = 0,
+        descending: bool = False,
+        conversation_ids: Optional[Sequence[str]] = None,
         **kwargs,
     ) -> List[ConversationItem]:
+        if conversation_ids is not None and not conversation_ids:
+            return []
         await self._ensure_initialized()
         params = []
         where_clauses = []
         if conversation_id is not None:
             where_clauses.append("conversation_id = ?")
             params.append(conversation_id)
+        if conversation_ids is not None:
+            placeholders = ", ".join("?" * len(conversation_ids))
+            where_clauses.append(f"conversation_id IN ({placeholders})")
+            params.extend(conversation_ids)
         if role is not None:
             where_clauses.append("role = ?")
             params.append(getattr(role, "value", str(role)))
@@ -215,7 +234,12 @@ class SQLiteItemStore(ItemStore):
 
         where = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
 
-        sql = f"SELECT * FROM conversation_items {where} ORDER BY datetime(created_at) ASC"
+        # rowid breaks ties between items created within the same second
+        direction = "DESC" if descending else "ASC"
+        sql = (
+            f"SELECT * FROM conversation_items {where} "
+            f"ORDER BY datetime(created_at) {direction}, rowid {direction}"
+        )
         if limit is not None:
             sql += " LIMIT ?"
             params.append(int(limit))
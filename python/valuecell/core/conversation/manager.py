@@ -1,6 +1,6 @@
 import json
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from valuecell.core.types import (
     ConversationItem,
@@ -87,6 +87,7 @@ class ConversationManager:
         item_id: Optional[str] = None,
         agent_name: Optional[str] = None,
         metadata: Optional[ResponseMetadata] = None,
+        touch_conversation: bool = True,
     ) -> Optional[ConversationItem]:
         """Add item to conversation
 
@@ -100,6 +101,7 @@ class ConversationManager:
             item_id: Item ID (optional)
             agent_name: Agent name (optional)
             metadata: Additional metadata as dict (optional)
+            touch_conversation: Bump the conversation's updated_at (optional)
         """
         # Verify conversation exists
         conversation = await self.get_conversation(conversation_id)
@@ -143,9 +145,12 @@ class ConversationManager:
         # Save item directly to item store
         await self.item_store.save_item(item)
 
-        # Update conversation timestamp
-        conversation.touch()
-        await self.conversation_store.save_conversation(conversation)
+        # Bump only the conversation timestamp once the item is stored instead
+        # of rewriting the whole conversation row
+        if touch_conversation:
+            await self.conversation_store.touch_conversation(
+                conversation_id, datetime.now()
+            )
 
         return item
 
@@ -156,6 +161,8 @@ class ConversationManager:
         component_type: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        descending: bool = False,
+        conversation_ids: Optional[Sequence[str]] = None,
     ) -> List[ConversationItem]:
         """Get items for a conversation with optional filtering and pagination
 
@@ -165,6 +172,8 @@ class ConversationManager:
             component_type: Filter by component type (optional)
             limit: Maximum number of items to return (optional, default: all)
             offset: Number of items to skip (optional, default: 0)
+            descending: Return newest items first (optional, default: False)
+            conversation_ids: Restrict to these conversation IDs (optional)
         """
         return await self.item_store.get_items(
             conversation_id=conversation_id,
@@ -172,6 +181,8 @@ class ConversationManager:
             component_type=component_type,
             limit=limit,
             offset=offset or 0,
+            descending=descending,
+            conversation_ids=conversation_ids,
         )
 
     async def get_latest_item(self, conversation_id: str) -> Optional[ConversationItem]:
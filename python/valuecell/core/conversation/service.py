@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
 from valuecell.core.conversation.manager import ConversationManager
 from valuecell.core.conversation.models import Conversation, ConversationStatus
@@ -87,6 +87,7 @@ class ConversationService:
         item_id: Optional[str] = None,
         agent_name: Optional[str] = None,
         metadata: Optional[ResponseMetadata] = None,
+        touch_conversation: bool = True,
     ) -> Optional[ConversationItem]:
         """Persist a conversation item via the underlying manager.
 
@@ -100,6 +101,7 @@ class ConversationService:
             item_id: Item ID (optional)
             agent_name: Agent name (optional)
             metadata: Additional metadata as dict (optional)
+            touch_conversation: Bump the conversation's updated_at (optional)
         """
 
         return await self._manager.add_item(
@@ -112,6 +114,7 @@ class ConversationService:
             item_id=item_id,
             agent_name=agent_name,
             metadata=metadata,
+            touch_conversation=touch_conversation,
         )
 
     async def get_conversation_items(
@@ -121,6 +124,8 @@ class ConversationService:
         component_type: Optional[str] = None,
         limit: Optional[int] = None,
         offset: Optional[int] = None,
+        descending: bool = False,
+        conversation_ids: Optional[Sequence[str]] = None,
     ) -> List[ConversationItem]:
         """Load conversation items with optional filtering and pagination.
 
@@ -130,6 +135,8 @@ class ConversationService:
             component_type: Filter by component type (optional)
             limit: Maximum number of items to return (optional, default: all)
             offset: Number of items to skip (optional, default: 0)
+            descending: Return newest items first (optional, default: False)
+            conversation_ids: Restrict to these conversation IDs (optional)
         """
 
         return await self._manager.get_conversation_items(
@@ -138,4 +145,6 @@ class ConversationService:
             component_type=component_type,
             limit=limit,
             offset=offset,
+            descending=descending,
+            conversation_ids=conversation_ids,
         )
@@ -227,7 +227,7 @@ class TestConversationManager:
             return_value=conversation
         )
         manager.item_store.save_item = AsyncMock()
-        manager.conversation_store.save_conversation = AsyncMock()
+        manager.conversation_store.touch_conversation = AsyncMock()
 
         with patch("valuecell.core.conversation.manager.generate_item_id") as mock_uuid:
             mock_uuid.return_value = "item-generated-123"
@@ -255,10 +255,35 @@ class TestConversationManager:
             manager.item_store.save_item.assert_called_once()
             saved_item = manager.item_store.save_item.call_args.args[0]
             assert saved_item.agent_name == "agent-123"
-            manager.conversation_store.save_conversation.assert_called_once_with(
-                conversation
+            manager.conversation_store.touch_conversation.assert_called_once()
+            touched_id, _ = manager.conversation_store.touch_conversation.call_args.args
+            assert touched_id == "conv-123"
+
+    @pytest.mark.asyncio
+    async def test_add_item_save_failure_keeps_conversation_timestamp(self):
+        """Test a failed item insert does not bump the conversation."""
+        manager = ConversationManager()
+
+        conversation = Conversation(conversation_id="conv-123", user_id="user-123")
+        updated_at = conversation.updated_at
+
+        manager.conversation_store.load_conversation = AsyncMock(
+            return_value=conversation
+        )
+        manager.item_store.save_item = AsyncMock(side_effect=RuntimeError("boom"))
+        manager.conversation_store.touch_conversation = AsyncMock()
+
+        with pytest.raises(RuntimeError):
+            await manager.add_item(
+                role=Role.USER,
+                event=NotifyResponseEvent.MESSAGE,
+                conversation_id="conv-123",
+                payload='{"message": "Hello"}',
             )
 
+        manager.conversation_store.touch_conversation.assert_not_called()
+        assert conversation.updated_at == updated_at
+
     @pytest.mark.asyncio
     async def test_add_item_conversation_not_exists(self):
         """Test adding item to nonexistent conversation."""
@@ -438,6 +463,8 @@ class TestConversationManager:
             component_type=None,
             limit=None,
             offset=0,
+            descending=False,
+            conversation_ids=None,
         )
 
     @pytest.mark.asyncio
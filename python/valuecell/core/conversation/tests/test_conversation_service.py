@@ -147,6 +147,7 @@ async def test_add_item_delegates_to_manager(manager: AsyncMock):
         item_id="item",
         agent_name=None,
         metadata=None,
+        touch_conversation=True,
     )
 
 
@@ -159,6 +160,7 @@ async def test_get_conversation_items_pass_through(manager: AsyncMock):
         conversation_id="conv",
         limit=1,
         offset=2,
+        descending=True,
     )
 
     assert items == ["item"]
@@ -168,4 +170,6 @@ async def test_get_conversation_items_pass_through(manager: AsyncMock):
         component_type=None,
         limit=1,
         offset=2,
+        descending=True,
+        conversation_ids=None,
     )
@@ -313,6 +313,25 @@ class TestSQLiteConversationStore:
         assert store._initialized
         assert store._init_lock is not None
 
+    @pytest.mark.asyncio
+    async def test_list_conversations_uses_user_index(self, temp_db_store):
+        """Test per-user listing is served by the (user_id, created_at) index."""
+        import aiosqlite
+
+        store = temp_db_store
+        await store._ensure_initialized()
+
+        async with aiosqlite.connect(store.db_path) as db:
+            cur = await db.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM conversations WHERE user_id = ? "
+                "ORDER BY created_at DESC LIMIT ? OFFSET ?",
+                ("user-1", 10, 0),
+            )
+            plan = " ".join(row[-1] for row in await cur.fetchall())
+
+        assert "idx_conv_user_time" in plan
+        assert "TEMP B-TREE" not in plan
+
     @pytest.mark.asyncio
     async def test_ensure_initialized_multiple_calls(self, temp_db_store):
         """Test that multiple initialization calls are safe."""
@@ -409,6 +428,127 @@ class TestSQLiteConversationStore:
         loaded = await store.load_conversation("conv-123")
         assert loaded is None
 
+    @pytest.mark.asyncio
+    async def test_load_conversation_returns_cached_copy(self, temp_db_store):
+        """Test cached loads can't be mutated by callers without saving."""
+        store = temp_db_store
+        await store.save_conversation(
+            Conversation(conversation_id="conv-123", user_id="user-123", title="A")
+        )
+
+        first = await store.load_conversation("conv-123")
+        first.title = "changed"
+        second = await store.load_conversation("conv-123")
+
+        assert second.title == "A"
+        assert second is not first
+
+    @pytest.mark.asyncio
+    async def test_delete_conversation_visible_to_other_store(self, temp_db_store):
+        """Test a delete through one store evicts the cache shared by the path."""
+        store = temp_db_store
+        other = SQLiteConversationStore(store.db_path)
+        await store.save_conversation(
+            Conversation(conversation_id="conv-123", user_id="user-123")
+        )
+        assert await other.load_conversation("conv-123") is not None
+
+        await store.delete_conversation("conv-123")
+
+        assert await other.load_conversation("conv-123") is None
+        assert not await other.conversation_exists("conv-123")
+
+    @pytest.mark.asyncio
+    async def test_load_conversation_cache_ttl_and_opt_out(self, tmp_path):
+        """Test expired or disabled cache entries are re-read from the database."""
+        import aiosqlite
+
+        db_path = str(tmp_path / "ttl.db")
+        expiring = SQLiteConversationStore(db_path, cache_ttl=0)
+        uncached = SQLiteConversationStore(db_path, use_cache=False)
+        await expiring.save_conversation(
+            Conversation(conversation_id="conv-123", user_id="user-123", title="A")
+        )
+
+        # Simulate a write from outside this process
+        async with aiosqlite.connect(db_path) as db:
+            await db.execute("UPDATE conversations SET title = 'B'")
+            await db.commit()
+
+        assert (await expiring.load_conversation("conv-123")).title == "B"
+        assert (await uncached.load_conversation("conv-123")).title == "B"
+
+    @pytest.mark.asyncio
+    async def test_touch_conversation_updates_only_timestamp(self, temp_db_store):
+        """Test touching keeps fields saved since the caller loaded the row."""
+        store = temp_db_store
+        uncached = SQLiteConversationStore(store.db_path, use_cache=False)
+        conversation = Conversation(
+            conversation_id="conv-123", user_id="user-123", title="A"
+        )
+        await store.save_conversation(conversation)
+        await store.save_conversation(conversation.model_copy(update={"title": "B"}))
+
+        touched_at = datetime(2030, 1, 1)
+        await store.touch_conversation("conv-123", touched_at)
+
+        for reader in (store, uncached):
+            loaded = await reader.load_conversation("conv-123")
+            assert loaded.title == "B"
+            assert loaded.updated_at == touched_at
+
+    @pytest.mark.asyncio
+    async def test_load_conversation_keeps_newer_cached_copy(self, temp_db_store):
+        """Test a load racing a save does not cache the older database row."""
+        store = temp_db_store
+        await store.save_conversation(
+            Conversation(
+                conversation_id="conv-123",
+                user_id="user-123",
+                updated_at=datetime(2024, 1, 1),
+            )
+        )
+        store._cache.clear()
+        newer = Conversation(
+            conversation_id="conv-123",
+            user_id="user-123",
+            title="Saved meanwhile",
+            updated_at=datetime(2024, 1, 2),
+        )
+
+        # A save caches a newer copy after the row was read but before the put
+        row_to_conversation = store._row_to_conversation
+
+        def read_then_save(row):
+            conversation = row_to_conversation(row)
+            store._cache_put(newer)
+            return conversation
+
+        store._row_to_conversation = read_then_save
+        await store.load_conversation("conv-123")
+        del store._row_to_conversation
+
+        cached = await store.load_conversation("conv-123")
+        assert cached.title == "Saved meanwhile"
+
+    @pytest.mark.asyncio
+    async def test_conversation_cache_shared_by_resolved_path(self, tmp_path):
+        """Test stores share one cache per file and drop it when unused."""
+        import gc
+
+        from valuecell.core.conversation import conversation_store
+
+        db_path = tmp_path / "shared.db"
+        store = SQLiteConversationStore(str(db_path))
+        alias = SQLiteConversationStore(str(tmp_path / "." / "shared.db"))
+        assert store._cache is alias._cache
+
+        key = str(db_path.resolve())
+        assert key in conversation_store._conversation_caches
+        del store, alias
+        gc.collect()
+        assert key not in conversation_store._conversation_caches
+
     @pytest.mark.asyncio
     async def test_delete_conversation_nonexistent(self, temp_db_store):
         """Test deleting a nonexistent conversation."""
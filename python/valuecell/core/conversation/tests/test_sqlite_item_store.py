@@ -195,6 +195,50 @@ async def test_sqlite_item_store_filters_and_pagination():
         second_page = await store.get_items("s2", limit=1, offset=1)
         assert len(second_page) == 1
 
+        # descending: newest items first, ties broken by insertion order
+        latest_two = await store.get_items("s2", limit=2, descending=True)
+        assert [i.item_id for i in latest_two] == ["a3", "a2"]
+
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_item_store_filters_by_conversation_ids():
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    try:
+        store = SQLiteItemStore(path)
+
+        # "mine-*" belong to the requesting user, "other" to someone else
+        for item_id, conversation_id in (
+            ("m1", "mine-1"),
+            ("m2", "mine-2"),
+            ("o1", "other"),
+        ):
+            await store.save_item(
+                ConversationItem(
+                    item_id=item_id,
+                    role=Role.AGENT,
+                    event=SystemResponseEvent.DONE,
+                    conversation_id=conversation_id,
+                    thread_id="t1",
+                    task_id=None,
+                    payload='{"component_type":"scheduled_task_result"}',
+                    metadata="{}",
+                )
+            )
+
+        mine = await store.get_items(
+            conversation_ids=["mine-1", "mine-2"],
+            component_type="scheduled_task_result",
+        )
+        assert [i.item_id for i in mine] == ["m1", "m2"]
+
+        # An empty id list matches nothing instead of every conversation
+        assert await store.get_items(conversation_ids=[]) == []
+
     finally:
         if os.path.exists(path):
             os.remove(path)
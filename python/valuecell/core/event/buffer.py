@@ -35,6 +35,19 @@ class SaveItem:
 # conversation_id, thread_id, task_id, event
 BufferKey = Tuple[str, Optional[str], Optional[str], object]
 
+# Streamed events aggregated into paragraph-level items
+BUFFERED_EVENTS = frozenset(
+    {
+        StreamResponseEvent.MESSAGE_CHUNK,
+        StreamResponseEvent.REASONING,
+    }
+)
+
+# Minimum seconds between intermediate upserts of the same paragraph
+DEFAULT_UPSERT_INTERVAL_SECONDS = 0.5
+# Minimum characters added since the last intermediate upsert of a paragraph
+DEFAULT_MIN_UPSERT_CHARS = 40
+
 
 class BufferEntry:
     """Represents an in-memory paragraph buffer for streamed chunks.
@@ -51,7 +64,12 @@ class BufferEntry:
         agent_name: Optional[str] = None,
     ):
         self.parts: List[str] = []
+        self.size: int = 0
         self.last_updated: float = time.monotonic()
+        # When the aggregate was last emitted as an upsert; -inf so the first
+        # chunk of a paragraph is always persisted right away.
+        self.last_upserted: float = float("-inf")
+        self.upserted_size: int = 0
         # Stable paragraph id for this buffer entry. Reused across streamed chunks
         # until this entry is flushed (debounce/boundary). On size-based flush,
         # we rotate to a new paragraph id for subsequent chunks.
@@ -63,16 +81,22 @@ class BufferEntry:
         """Append a chunk of text to this buffer and update the timestamp."""
         if text:
             self.parts.append(text)
+            self.size += len(text)
             self.last_updated = time.monotonic()
 
     def snapshot_payload(self) -> Optional[BaseResponseDataPayload]:
         """Return the current aggregate content as a payload without clearing.
 
+        The joined content replaces the buffered parts, so the next snapshot
+        only joins the chunks appended since this one.
+
         Returns None when there is no content buffered.
         """
         if not self.parts:
             return None
         content = "".join(self.parts)
+        if len(self.parts) > 1:
+            self.parts = [content]
         return BaseResponseDataPayload(content=content)
 
 
@@ -86,11 +110,22 @@ class ResponseBuffer:
         into paragraph-level items which are upserted as streaming progress
         is received. This preserves a stable paragraph `item_id` across chunks.
 
+    Intermediate upserts are throttled to one per `upsert_interval` seconds
+    per paragraph, and skipped until at least `min_upsert_chars` new
+    characters have arrived, so the aggregate is only joined when it is
+    actually emitted. The final aggregate is always emitted on flush.
+
     The buffer key is a tuple (conversation_id, thread_id, task_id, event).
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        upsert_interval: float = DEFAULT_UPSERT_INTERVAL_SECONDS,
+        min_upsert_chars: int = DEFAULT_MIN_UPSERT_CHARS,
+    ):
         self._buffers: Dict[BufferKey, BufferEntry] = {}
+        self._upsert_interval = upsert_interval
+        self._min_upsert_chars = min_upsert_chars
 
         self._immediate_events = {
             StreamResponseEvent.TOOL_CALL_COMPLETED,
@@ -99,10 +134,7 @@ class ResponseBuffer:
             SystemResponseEvent.PLAN_REQUIRE_USER_INPUT,
             SystemResponseEvent.THREAD_STARTED,
         }
-        self._buffered_events = {
-            StreamResponseEvent.MESSAGE_CHUNK,
-            StreamResponseEvent.REASONING,
-        }
+        self._buffered_events = BUFFERED_EVENTS
 
     def annotate(self, resp: BaseResponse) -> BaseResponse:
         """Stamp buffered responses with a stable paragraph `item_id`.
@@ -138,8 +170,9 @@ class ResponseBuffer:
 
         Depending on the event type this will either:
         - Flush and emit an immediate item (for immediate events), or
-        - Accumulate buffered chunks and emit an upsert SaveItem with the
-          current aggregated payload for the paragraph entry.
+        - Accumulate buffered chunks and, at most once per upsert interval,
+          emit an upsert SaveItem with the current aggregated payload for the
+          paragraph entry.
 
         Returns:
             A list of SaveItem objects that should be persisted by the caller.
@@ -190,7 +223,17 @@ class ResponseBuffer:
 
             if text:
                 entry.append(text)
-                # Always upsert current aggregate (no size-based rotation)
+                # Only materialize the aggregate when a throttled upsert fires
+                now = entry.last_updated
+                if now - entry.last_upserted < self._upsert_interval:
+                    return out
+                if (
+                    entry.upserted_size
+                    and entry.size - entry.upserted_size < self._min_upsert_chars
+                ):
+                    return out
+                entry.last_upserted = now
+                entry.upserted_size = entry.size
                 snap = entry.snapshot_payload()
                 if snap is not None:
                     out.append(
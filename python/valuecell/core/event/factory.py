@@ -1,3 +1,4 @@
+import json
 from typing import Optional
 
 from typing_extensions import Literal
@@ -33,6 +34,51 @@ from valuecell.core.types import (
 )
 from valuecell.utils.uuid import generate_item_id, generate_uuid
 
+# Persisted string value -> event/role enum, for items stored without enums
+_EVENTS_BY_VALUE = {
+    member.value: member
+    for enum_cls in (
+        SystemResponseEvent,
+        StreamResponseEvent,
+        NotifyResponseEvent,
+        CommonResponseEvent,
+        TaskStatusEvent,
+    )
+    for member in enum_cls
+}
+_ROLES_BY_VALUE = {member.value: member for member in Role}
+
+# Persisted event -> (response type, payload model) used to rebuild history
+_ITEM_RESPONSE_TYPES = {
+    # System-level events
+    SystemResponseEvent.THREAD_STARTED: (
+        ThreadStartedResponse,
+        BaseResponseDataPayload,
+    ),
+    SystemResponseEvent.PLAN_REQUIRE_USER_INPUT: (
+        PlanRequireUserInputResponse,
+        BaseResponseDataPayload,
+    ),
+    # Stream/notify/common events
+    StreamResponseEvent.MESSAGE_CHUNK: (MessageResponse, BaseResponseDataPayload),
+    NotifyResponseEvent.MESSAGE: (MessageResponse, BaseResponseDataPayload),
+    StreamResponseEvent.REASONING: (ReasoningResponse, BaseResponseDataPayload),
+    StreamResponseEvent.REASONING_STARTED: (
+        ReasoningResponse,
+        BaseResponseDataPayload,
+    ),
+    StreamResponseEvent.REASONING_COMPLETED: (
+        ReasoningResponse,
+        BaseResponseDataPayload,
+    ),
+    CommonResponseEvent.COMPONENT_GENERATOR: (
+        ComponentGeneratorResponse,
+        ComponentGeneratorResponseDataPayload,
+    ),
+    StreamResponseEvent.TOOL_CALL_STARTED: (ToolCallResponse, ToolCallPayload),
+    StreamResponseEvent.TOOL_CALL_COMPLETED: (ToolCallResponse, ToolCallPayload),
+}
+
 
 class ResponseFactory:
     def from_conversation_item(self, item: ConversationItem):
@@ -56,25 +102,11 @@ class ResponseFactory:
         # Coerce enums that may have been persisted as strings
         ev = item.event
         if isinstance(ev, str):
-            for enum_cls in (
-                SystemResponseEvent,
-                StreamResponseEvent,
-                NotifyResponseEvent,
-                CommonResponseEvent,
-                TaskStatusEvent,
-            ):
-                try:
-                    ev = enum_cls(ev)  # type: ignore[arg-type]
-                    break
-                except Exception:
-                    continue
+            ev = _EVENTS_BY_VALUE.get(ev, ev)
 
         role = item.role
         if isinstance(role, str):
-            try:
-                role = Role(role)
-            except Exception:
-                role = Role.AGENT
+            role = _ROLES_BY_VALUE.get(role, Role.AGENT)
 
         # Helpers for payload parsing
         def parse_payload_as(model_cls):
@@ -96,8 +128,6 @@ class ResponseFactory:
             if not raw_metadata:
                 return None
             try:
-                import json
-
                 return json.loads(raw_metadata)
             except Exception:
                 return None
@@ -115,47 +145,11 @@ class ResponseFactory:
                 metadata=parse_metadata(),
             )
 
-        # ----- System-level events -----
-        if ev == SystemResponseEvent.THREAD_STARTED:
-            payload = parse_payload_as(BaseResponseDataPayload)
-            return ThreadStartedResponse(data=make_data(payload))
-
-        if ev == SystemResponseEvent.PLAN_REQUIRE_USER_INPUT:
-            payload = parse_payload_as(BaseResponseDataPayload)
-            return PlanRequireUserInputResponse(data=make_data(payload))
-
-        # ----- Stream/notify/common events -----
-        if ev == StreamResponseEvent.MESSAGE_CHUNK:
-            payload = parse_payload_as(BaseResponseDataPayload)
-            return MessageResponse(
-                event=StreamResponseEvent.MESSAGE_CHUNK, data=make_data(payload)
-            )
-
-        if ev == NotifyResponseEvent.MESSAGE:
-            payload = parse_payload_as(BaseResponseDataPayload)
-            return MessageResponse(
-                event=NotifyResponseEvent.MESSAGE, data=make_data(payload)
-            )
-
-        if ev in (
-            StreamResponseEvent.REASONING,
-            StreamResponseEvent.REASONING_STARTED,
-            StreamResponseEvent.REASONING_COMPLETED,
-        ):
-            payload = parse_payload_as(BaseResponseDataPayload)
-            # ReasoningResponse accepts optional payload
-            return ReasoningResponse(event=ev, data=make_data(payload))
-
-        if ev == CommonResponseEvent.COMPONENT_GENERATOR:
-            payload = parse_payload_as(ComponentGeneratorResponseDataPayload)
-            return ComponentGeneratorResponse(data=make_data(payload))
-
-        if ev in (
-            StreamResponseEvent.TOOL_CALL_STARTED,
-            StreamResponseEvent.TOOL_CALL_COMPLETED,
-        ):
-            payload = parse_payload_as(ToolCallPayload)
-            return ToolCallResponse(event=ev, data=make_data(payload))
+        response_types = _ITEM_RESPONSE_TYPES.get(ev)
+        if response_types is not None:
+            response_cls, payload_cls = response_types
+            payload = parse_payload_as(payload_cls)
+            return response_cls(event=ev, data=make_data(payload))
 
         raise ValueError(
             f"Unsupported event type: {ev} when processing conversation item."
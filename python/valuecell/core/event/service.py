@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+import asyncio
+import logging
+from functools import partial
+from typing import Iterable, Optional, Tuple
 
 from valuecell.core.conversation.service import ConversationService
-from valuecell.core.event.buffer import ResponseBuffer, SaveItem
+from valuecell.core.event.buffer import BUFFERED_EVENTS, ResponseBuffer, SaveItem
 from valuecell.core.event.factory import ResponseFactory
 from valuecell.core.event.router import RouteResult, handle_status_update
 from valuecell.core.task.models import Task
 from valuecell.core.types import BaseResponse
 
+logger = logging.getLogger(__name__)
+
+# (conversation_id, thread_id, task_id) owning a set of pending upserts
+UpsertKey = Tuple[str, Optional[str], Optional[str]]
+
 
 class EventResponseService:
-    """Provide a single entry point for response creation and persistence."""
+    """Provide a single entry point for response creation and persistence.
+
+    Intermediate paragraph upserts produced by streamed chunks are written
+    behind the stream by one background writer per task context. Pending
+    upserts are coalesced by item_id so only the latest snapshot of a
+    paragraph is written, and a context is drained before any other item of
+    that context is persisted to keep storage order intact. A failed
+    snapshot write is logged and dropped, since the paragraph's final flush
+    supersedes it.
+    """
 
     def __init__(
         self,
@@ -24,6 +41,8 @@ class EventResponseService:
         self._conversation_service = conversation_service
         self._factory = response_factory or ResponseFactory()
         self._buffer = response_buffer or ResponseBuffer()
+        self._pending_upserts: dict[UpsertKey, dict[str, SaveItem]] = {}
+        self._upsert_writers: dict[UpsertKey, asyncio.Task] = {}
 
     @property
     def factory(self) -> ResponseFactory:
@@ -53,6 +72,7 @@ class EventResponseService:
     ) -> None:
         """Force-flush buffered paragraphs for a task context."""
 
+        await self._drain_pending_upserts(conversation_id, thread_id, task_id)
         items = self._buffer.flush_task(conversation_id, thread_id, task_id)
         await self._persist_items(items)
 
@@ -63,9 +83,90 @@ class EventResponseService:
 
     async def _persist_from_buffer(self, response: BaseResponse) -> None:
         items = self._buffer.ingest(response)
+        if not items:
+            return
+        if response.event in BUFFERED_EVENTS:
+            self._schedule_upserts(items)
+            return
+        data = response.data
+        await self._drain_pending_upserts(
+            data.conversation_id, data.thread_id, data.task_id
+        )
         await self._persist_items(items)
 
-    async def _persist_items(self, items: list[SaveItem]) -> None:
+    def _schedule_upserts(self, items: list[SaveItem]) -> None:
+        """Queue paragraph upserts, replacing older snapshots of the same item."""
+        for item in items:
+            key = (item.conversation_id, item.thread_id, item.task_id)
+            self._pending_upserts.setdefault(key, {})[item.item_id] = item
+            if key not in self._upsert_writers:
+                self._start_upsert_writer(key)
+
+    def _start_upsert_writer(self, key: UpsertKey) -> None:
+        writer = asyncio.create_task(self._write_pending_upserts(key))
+        writer.add_done_callback(partial(self._on_upsert_writer_done, key))
+        self._upsert_writers[key] = writer
+
+    async def _write_pending_upserts(self, key: UpsertKey) -> None:
+        pending = self._pending_upserts[key]
+        while pending:
+            item_id = next(iter(pending))
+            item = pending.pop(item_id)
+            # Snapshots leave the conversation row alone so they can't race
+            # status/title updates made by the main flow
+            await self._persist_items([item], touch_conversation=False)
+
+    def _on_upsert_writer_done(self, key: UpsertKey, writer: asyncio.Task) -> None:
+        """Deregister a finished writer, logging the snapshot it failed to write.
+
+        Intermediate snapshots are superseded by the final flush of their
+        paragraph, so a failed write is logged and dropped rather than raised.
+        """
+        if self._upsert_writers.get(key) is writer:
+            del self._upsert_writers[key]
+        if not writer.cancelled() and writer.exception() is not None:
+            logger.error(
+                "Failed to persist intermediate upsert for %s",
+                key,
+                exc_info=writer.exception(),
+            )
+        if self._pending_upserts.get(key):
+            if key not in self._upsert_writers:
+                self._start_upsert_writer(key)
+        else:
+            self._pending_upserts.pop(key, None)
+
+    async def _drain_pending_upserts(
+        self,
+        conversation_id: str,
+        thread_id: Optional[str],
+        task_id: Optional[str],
+    ) -> None:
+        """Wait until queued paragraph upserts of a task context are written.
+
+        `thread_id`/`task_id` of None match any value, mirroring
+        `ResponseBuffer.flush_task`. Never raises: failed snapshots are
+        logged and dropped by the writer's done callback.
+        """
+        keys = [
+            key
+            for key in self._upsert_writers
+            if key[0] == conversation_id
+            and (thread_id is None or key[1] == thread_id)
+            and (task_id is None or key[2] == task_id)
+        ]
+        for key in keys:
+            while (writer := self._upsert_writers.get(key)) is not None:
+                # wait() neither raises the writer's error nor cancels it
+                # when the caller is cancelled
+                await asyncio.wait({writer})
+                if self._upsert_writers.get(key) is writer:
+                    # Let the done callback deregister the writer
+                    await asyncio.sleep(0)
+
+    async def _persist_items(
+        self, items: list[SaveItem], touch_conversation: bool = True
+    ) -> None:
         for item in items:
             await self._conversation_service.add_item(
                 role=item.role,
@@ -77,4 +178,5 @@ class EventResponseService:
                 item_id=item.item_id,
                 agent_name=item.agent_name,
                 metadata=item.metadata,
+                touch_conversation=touch_conversation,
             )
@@ -1,12 +1,13 @@
+import asyncio
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
 
-from valuecell.core.event.buffer import SaveItem
+from valuecell.core.event.buffer import ResponseBuffer, SaveItem
 from valuecell.core.event.factory import ResponseFactory
 from valuecell.core.event.service import EventResponseService
-from valuecell.core.types import NotifyResponseEvent, Role
+from valuecell.core.types import NotifyResponseEvent, Role, StreamResponseEvent
 
 
 class DummyBuffer:
@@ -136,6 +137,125 @@ async def test_flush_task_response(
     assert kwargs["item_id"] == "item-flush"
 
 
+@pytest.mark.asyncio
+async def test_buffered_upserts_are_coalesced(
+    response_factory: ResponseFactory, conversation_service: AsyncMock
+):
+    service = EventResponseService(
+        conversation_service=conversation_service,
+        response_factory=response_factory,
+        response_buffer=ResponseBuffer(upsert_interval=0, min_upsert_chars=0),
+    )
+
+    for content in ("a", "b", "c"):
+        await service.emit(
+            response_factory.message_response_general(
+                event=StreamResponseEvent.MESSAGE_CHUNK,
+                conversation_id="conv",
+                thread_id="thread",
+                task_id="task",
+                content=content,
+            )
+        )
+    await service.flush_task_response("conv", "thread", "task")
+
+    calls = conversation_service.add_item.call_args_list
+    assert len(calls) == 2
+    assert calls[0].kwargs["item_id"] == calls[1].kwargs["item_id"]
+    assert [c.kwargs["payload"].content for c in calls] == ["abc", "abc"]
+
+
+def _chunk(factory: ResponseFactory, conversation_id: str, content: str):
+    return factory.message_response_general(
+        event=StreamResponseEvent.MESSAGE_CHUNK,
+        conversation_id=conversation_id,
+        thread_id="thread",
+        task_id="task",
+        content=content,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_contexts_keep_final_upsert(
+    response_factory: ResponseFactory,
+):
+    stored = {}
+    release_first_write = asyncio.Event()
+    first_write = True
+
+    async def add_item(**kwargs):
+        nonlocal first_write
+        if first_write:
+            first_write = False
+            await release_first_write.wait()
+        stored[kwargs["conversation_id"]] = kwargs["payload"].content
+
+    conversation_service = AsyncMock()
+    conversation_service.add_item = AsyncMock(side_effect=add_item)
+    service = EventResponseService(
+        conversation_service=conversation_service,
+        response_factory=response_factory,
+        response_buffer=ResponseBuffer(upsert_interval=0, min_upsert_chars=0),
+    )
+
+    # Conversation B's first upsert blocks inside the store
+    await service.emit(_chunk(response_factory, "conv-b", "b1"))
+    await asyncio.sleep(0)
+    await service.emit(_chunk(response_factory, "conv-a", "a1"))
+
+    # A drains without waiting on B's slow write
+    await asyncio.wait_for(service.flush_task_response("conv-a", None, None), 1)
+    assert stored["conv-a"] == "a1"
+
+    await service.emit(_chunk(response_factory, "conv-b", "b2"))
+    flush_b = asyncio.create_task(service.flush_task_response("conv-b", None, None))
+    await asyncio.sleep(0)
+    assert not flush_b.done()
+    release_first_write.set()
+    await flush_b
+
+    assert stored["conv-b"] == "b1b2"
+
+
+@pytest.mark.asyncio
+async def test_failed_upsert_is_dropped_and_final_flush_still_runs(
+    response_factory: ResponseFactory,
+):
+    stored = {}
+    failures = iter([RuntimeError("write failed")])
+
+    async def add_item(**kwargs):
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        stored[kwargs["item_id"]] = (
+            kwargs["payload"].content,
+            kwargs["touch_conversation"],
+        )
+
+    conversation_service = AsyncMock()
+    conversation_service.add_item = AsyncMock(side_effect=add_item)
+    service = EventResponseService(
+        conversation_service=conversation_service,
+        response_factory=response_factory,
+        response_buffer=ResponseBuffer(upsert_interval=0, min_upsert_chars=0),
+    )
+
+    await service.emit(_chunk(response_factory, "conv", "a"))
+    await service.emit(_chunk(response_factory, "other", "x"))
+    await service.emit(_chunk(response_factory, "conv", "b"))
+    # Let the writers finish, including the failed one, without draining
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert service._upsert_writers == {}
+
+    await service.flush_task_response("conv", None, None)
+
+    # The final aggregate is written and bumps the conversation; snapshots don't
+    assert ("ab", True) in stored.values()
+    assert ("x", False) in stored.values()
+
+
 @pytest.mark.asyncio
 async def test_route_task_status(
     monkeypatch: pytest.MonkeyPatch, event_service: EventResponseService
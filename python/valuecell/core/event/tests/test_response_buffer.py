@@ -103,6 +103,19 @@ class TestBufferEntry:
         assert isinstance(result, BaseResponseDataPayload)
         assert result.content == "Hello World"
 
+    def test_snapshot_payload_compacts_parts(self):
+        """Test snapshot_payload folds joined parts into a single part."""
+        entry = BufferEntry()
+        entry.append("Hello")
+        entry.append(" World")
+        entry.snapshot_payload()
+
+        assert entry.parts == ["Hello World"]
+
+        entry.append("!")
+        assert entry.snapshot_payload().content == "Hello World!"
+        assert entry.parts == ["Hello World!"]
+
 
 class TestResponseBuffer:
     """Test ResponseBuffer class."""
@@ -256,7 +269,7 @@ class TestResponseBuffer:
     @pytest.mark.asyncio
     async def test_ingest_buffered_event_multiple_chunks(self):
         """Test ingest with multiple buffered chunks."""
-        buffer = ResponseBuffer()
+        buffer = ResponseBuffer(upsert_interval=0, min_upsert_chars=0)
 
         # First chunk
         response1 = BaseResponse(
@@ -286,6 +299,55 @@ class TestResponseBuffer:
         assert result1[0].payload.content == "Hello"
         assert result2[0].payload.content == "Hello World"
 
+    @pytest.mark.asyncio
+    async def test_ingest_buffered_event_throttles_upserts(self):
+        """Test chunks within the upsert interval are buffered, not emitted."""
+        buffer = ResponseBuffer(upsert_interval=60)
+
+        results = [
+            buffer.ingest(
+                BaseResponse(
+                    event=StreamResponseEvent.MESSAGE_CHUNK,
+                    data=UnifiedResponseData(
+                        conversation_id="conv-123",
+                        role=Role.AGENT,
+                        payload=BaseResponseDataPayload(content=content),
+                    ),
+                )
+            )
+            for content in ("Hello", " World", "!")
+        ]
+
+        assert [len(r) for r in results] == [1, 0, 0]
+        assert results[0][0].payload.content == "Hello"
+
+        flushed = buffer.flush_task("conv-123", None, None)
+        assert len(flushed) == 1
+        assert flushed[0].item_id == results[0][0].item_id
+        assert flushed[0].payload.content == "Hello World!"
+
+    @pytest.mark.asyncio
+    async def test_ingest_buffered_event_skips_small_deltas(self):
+        """Test upserts wait until enough new content has accumulated."""
+        buffer = ResponseBuffer(upsert_interval=0, min_upsert_chars=10)
+
+        results = [
+            buffer.ingest(
+                BaseResponse(
+                    event=StreamResponseEvent.MESSAGE_CHUNK,
+                    data=UnifiedResponseData(
+                        conversation_id="conv-123",
+                        role=Role.AGENT,
+                        payload=BaseResponseDataPayload(content=content),
+                    ),
+                )
+            )
+            for content in ("Hi", " there", ", how are you?")
+        ]
+
+        assert [len(r) for r in results] == [1, 0, 1]
+        assert results[2][0].payload.content == "Hi there, how are you?"
+
     @pytest.mark.asyncio
     async def test_ingest_unknown_event(self):
         """Test ingest with unknown event type."""
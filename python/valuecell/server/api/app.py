@@ -8,6 +8,11 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from ...adapters.assets import get_adapter_manager
 from ..config.settings import get_settings
+from ..db.connection import (
+    dispose_async_engine,
+    get_database_manager,
+    warm_up_async_pool,
+)
 from .exceptions import (
     APIException,
     api_exception_handler,
@@ -60,9 +65,21 @@ def create_app() -> FastAPI:
         except Exception as e:
             print(f"Error configuring adapters: {e}")
 
+        # Fail fast on a database backend the async engine cannot serve;
+        # sync-only users (init_db, repositories) never build this engine
+        get_database_manager().get_async_engine()
+
+        # Open pooled database connections ahead of the first requests
+        try:
+            await warm_up_async_pool()
+            print("✓ Database connection pool warmed up")
+        except Exception as e:
+            print(f"✗ Database connection pool warm-up failed: {e}")
+
         yield
         # Shutdown
         print("ValueCell Server shutting down...")
+        await dispose_async_engine()
 
     app = FastAPI(
         title="ValueCell Server API",
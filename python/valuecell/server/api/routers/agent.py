@@ -5,7 +5,7 @@ Agent API router for handling agent-related endpoints.
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from valuecell.server.api.schemas.agent import (
     AgentEnableRequest,
@@ -15,7 +15,7 @@ from valuecell.server.api.schemas.agent import (
     AgentResponse,
 )
 from valuecell.server.api.schemas.base import SuccessResponse
-from valuecell.server.db import get_db
+from valuecell.server.db import get_async_db
 from valuecell.server.services.agent_service import AgentService
 
 
@@ -39,7 +39,7 @@ def create_agent_router() -> APIRouter:
         name_filter: Optional[str] = Query(
             None, description="Filter agents by name (supports fuzzy matching)"
         ),
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
     ) -> AgentListResponse:
         """
         Get all agents list.
@@ -50,7 +50,7 @@ def create_agent_router() -> APIRouter:
         Returns a response containing the agent list and statistics.
         """
         try:
-            agent_list_data = AgentService.get_all_agents(
+            agent_list_data = await AgentService.get_all_agents(
                 db=db, enabled_only=enabled_only, name_filter=name_filter
             )
             return SuccessResponse.create(
@@ -70,7 +70,7 @@ def create_agent_router() -> APIRouter:
     )
     async def get_agent_by_id(
         agent_id: int = Path(..., description="Unique identifier of the agent"),
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
     ) -> AgentResponse:
         """
         Get detailed information of a specific agent by ID.
@@ -80,7 +80,7 @@ def create_agent_router() -> APIRouter:
         Returns detailed agent information, or 404 error if agent doesn't exist.
         """
         try:
-            agent = AgentService.get_agent_by_id(db=db, agent_id=agent_id)
+            agent = await AgentService.get_agent_by_id(db=db, agent_id=agent_id)
             if not agent:
                 raise HTTPException(
                     status_code=404, detail=f"Agent with ID {agent_id} not found"
@@ -104,7 +104,7 @@ def create_agent_router() -> APIRouter:
     )
     async def get_agent_by_name(
         agent_name: str = Path(..., description="Name of the agent"),
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
     ) -> AgentResponse:
         """
         Get detailed information of a specific agent by name.
@@ -114,7 +114,7 @@ def create_agent_router() -> APIRouter:
         Returns detailed agent information, or 404 error if agent doesn't exist.
         """
         try:
-            agent = AgentService.get_agent_by_name(db=db, agent_name=agent_name)
+            agent = await AgentService.get_agent_by_name(db=db, agent_name=agent_name)
             if not agent:
                 raise HTTPException(
                     status_code=404, detail=f"Agent with name '{agent_name}' not found"
@@ -139,7 +139,7 @@ def create_agent_router() -> APIRouter:
     async def update_agent_enable_status(
         agent_name: str = Path(..., description="Name of the agent"),
         request: AgentEnableRequest = ...,
-        db: Session = Depends(get_db),
+        db: AsyncSession = Depends(get_async_db),
     ) -> AgentEnableSuccessResponse:
         """
         Update the enabled status of a specific agent by name.
@@ -150,7 +150,7 @@ def create_agent_router() -> APIRouter:
         Returns updated agent status information, or 404 error if agent doesn't exist.
         """
         try:
-            updated_agent = AgentService.update_agent_enabled(
+            updated_agent = await AgentService.update_agent_enabled(
                 db=db, agent_name=agent_name, enabled=request.enabled
             )
             if not updated_agent:
@@ -72,12 +72,15 @@ def create_conversation_router() -> APIRouter:
     )
     async def get_conversation_history(
         conversation_id: str = Path(..., description="The conversation ID"),
+        limit: Optional[int] = Query(
+            None, ge=1, description="Only return the most recent N items"
+        ),
     ) -> ConversationHistoryResponse:
         """Get conversation history."""
         try:
             service = get_conversation_service()
             data = await service.get_conversation_history(
-                conversation_id=conversation_id
+                conversation_id=conversation_id, limit=limit
             )
             return ConversationHistoryResponse.create(
                 data=data, msg="Conversation history retrieved successfully"
@@ -43,6 +43,11 @@ class Settings:
 
         # Database Configuration
         self.DATABASE_URL = os.getenv("VALUECELL_SQLITE_DB", _default_db_path())
+        # Connection pool tuning (ignored for SQLite)
+        self.DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+        self.DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+        self.DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))
+        self.DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
 
         # File Paths
         self.BASE_DIR = Path(__file__).parent.parent.parent
@@ -54,7 +59,13 @@ class Settings:
 
     def get_database_config(self) -> dict:
         """Get database configuration."""
-        return {"url": self.DATABASE_URL}
+        return {
+            "url": self.DATABASE_URL,
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+        }
 
     def update_language(self, language: str) -> None:
         """Update current language setting.
@@ -2,6 +2,7 @@
 
 from .connection import (
     DatabaseManager,
+    get_async_db,
     get_database_manager,
     get_db,
 )
@@ -13,6 +14,7 @@ __all__ = [
     "DatabaseManager",
     "get_database_manager",
     "get_db",
+    "get_async_db",
     # Database initialization
     "DatabaseInitializer",
     "init_database",
@@ -1,14 +1,84 @@
 """Database connection and session management for ValueCell Server."""
 
-from typing import Generator
-
-from sqlalchemy import Engine, create_engine
+import asyncio
+import importlib.util
+from typing import AsyncGenerator, Generator
+
+from sqlalchemy import URL, Engine, create_engine, event, make_url, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from ..config.settings import get_settings
 from .models.base import Base
 
+# Compiled statement cache entries per engine; kept explicit so it is never
+# disabled by accident (0 would recompile every statement)
+DEFAULT_QUERY_CACHE_SIZE = 1200
+
+# Applied to every new SQLite connection: WAL lets readers proceed while a
+# write is in progress, and NORMAL sync is safe under WAL.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Backend name -> (async driver name, module providing it) for the async engine;
+# asyncpg comes with the "postgres" optional extra
+_ASYNC_DRIVERS = {
+    "sqlite": ("sqlite+aiosqlite", "aiosqlite"),
+    "postgresql": ("postgresql+asyncpg", "asyncpg"),
+}
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Configure a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+def _async_database_url(database_url: str) -> URL:
+    """Map a configured database URL onto the async driver for its backend.
+
+    Explicit sync drivers (e.g. ``postgresql+psycopg2``) are swapped for the
+    async one. Raises if the backend has no async driver or it is missing.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        supported = ", ".join(sorted(_ASYNC_DRIVERS))
+        raise ValueError(
+            f"Unsupported database backend '{backend}' for async access; "
+            f"supported backends: {supported}"
+        )
+    drivername, module = _ASYNC_DRIVERS[backend]
+    if importlib.util.find_spec(module) is None:
+        raise RuntimeError(
+            f"Database backend '{backend}' requires the '{module}' package "
+            f"for async access; install it or use a SQLite database URL"
+        )
+    return url.set(drivername=drivername)
+
+
+def _server_pool_args(database_config: dict) -> dict:
+    """Pool arguments shared by the sync and async engines of server databases."""
+    return {
+        "pool_size": database_config["pool_size"],
+        "max_overflow": database_config["max_overflow"],
+        "pool_pre_ping": database_config["pool_pre_ping"],
+        "pool_recycle": database_config["pool_recycle"],
+    }
+
 
 class DatabaseManager:
     """Database connection and session manager."""
@@ -18,6 +88,8 @@ class DatabaseManager:
         self.settings = get_settings()
         self.engine: Engine = None
         self.SessionLocal = None
+        self.async_engine: AsyncEngine = None
+        self.AsyncSessionLocal = None
         self._initialize_engine()
 
     def _initialize_engine(self) -> None:
@@ -32,18 +104,45 @@ class DatabaseManager:
                 "timeout": 20,
             }
 
+        if database_config["url"].startswith("sqlite"):
+            pool_args = {"poolclass": StaticPool}
+        else:
+            pool_args = _server_pool_args(database_config)
+
         self.engine = create_engine(
             database_config["url"],
             connect_args=connect_args,
-            poolclass=StaticPool
-            if database_config["url"].startswith("sqlite")
-            else None,
+            query_cache_size=DEFAULT_QUERY_CACHE_SIZE,
+            **pool_args,
         )
+        if self.engine.dialect.name == "sqlite":
+            event.listen(self.engine, "connect", _apply_sqlite_pragmas)
 
         self.SessionLocal = sessionmaker(
             autocommit=False, autoflush=False, bind=self.engine
         )
 
+    def _initialize_async_engine(self) -> None:
+        """Initialize async database engine (created on first async session)."""
+        database_config = self.settings.get_database_config()
+        url = _async_database_url(database_config["url"])
+
+        if url.get_backend_name() == "sqlite":
+            engine_args = {"connect_args": {"timeout": 20}}
+        else:
+            engine_args = _server_pool_args(database_config)
+
+        self.async_engine = create_async_engine(
+            url, query_cache_size=DEFAULT_QUERY_CACHE_SIZE, **engine_args
+        )
+        if url.get_backend_name() == "sqlite":
+            event.listen(
+                self.async_engine.sync_engine, "connect", _apply_sqlite_pragmas
+            )
+        self.AsyncSessionLocal = async_sessionmaker(
+            bind=self.async_engine, autoflush=False, expire_on_commit=False
+        )
+
     def get_engine(self) -> Engine:
         """Get database engine."""
         return self.engine
@@ -60,6 +159,18 @@ class DatabaseManager:
         """Get a new database session."""
         return self.SessionLocal()
 
+    def get_async_engine(self) -> AsyncEngine:
+        """Get async database engine, creating it on first use."""
+        if self.async_engine is None:
+            self._initialize_async_engine()
+        return self.async_engine
+
+    def get_async_session(self) -> AsyncSession:
+        """Get a new async database session."""
+        if self.AsyncSessionLocal is None:
+            self._initialize_async_engine()
+        return self.AsyncSessionLocal()
+
     def get_db_session(self) -> Generator[Session, None, None]:
         """Get database session for dependency injection."""
         db = self.SessionLocal()
@@ -87,6 +198,32 @@ def get_db() -> Generator[Session, None, None]:
     yield from db_manager.get_db_session()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Get async database session for FastAPI dependency injection."""
+    async with get_database_manager().get_async_session() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections, if the database manager was created."""
+    if _db_manager is not None and _db_manager.async_engine is not None:
+        await _db_manager.async_engine.dispose()
+
+
+async def warm_up_async_pool() -> None:
+    """Open the async pool's base connections before the first request needs them."""
+    engine = get_database_manager().get_async_engine()
+    if not isinstance(engine.pool, QueuePool):
+        return
+
+    async def ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    # Concurrent checkouts force the pool to open distinct connections
+    await asyncio.gather(*(ping() for _ in range(engine.pool.size())))
+
+
 def get_engine() -> Engine:
     """Get database engine."""
     return get_database_manager().get_engine()
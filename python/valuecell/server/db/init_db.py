@@ -135,6 +135,14 @@ class DatabaseInitializer:
                 """)
                 )
 
+                # Create index for per-user conversation listings
+                conn.execute(
+                    text("""
+                    CREATE INDEX IF NOT EXISTS idx_conv_user_time
+                    ON conversations(user_id, created_at)
+                """)
+                )
+
                 # Create conversation_items table
                 conn.execute(
                     text("""
@@ -239,13 +247,11 @@ class DatabaseInitializer:
                                     "last_search_query": query,
                                 }
 
+                                # Field and metadata updates share one commit
                                 asset_repo.update_asset(
                                     symbol=asset_ticker,
                                     name=asset_data["display_name"],
                                     asset_type=asset_data["asset_type"],
-                                )
-                                asset_repo.update_asset_metadata(
-                                    symbol=asset_ticker,
                                     metadata_updates=metadata_updates,
                                 )
                                 logger.info(
@@ -6,12 +6,32 @@ This module provides database operations for asset management.
 
 from typing import List, Optional
 
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
+from sqlalchemy.sql import func
 
 from ..connection import get_database_manager
 from ..models.asset import Asset
 
+# Columns that upsert_asset leaves untouched when the caller passes None
+_UPSERT_OPTIONAL_FIELDS = (
+    "description",
+    "sector",
+    "current_price",
+    "asset_metadata",
+    "config",
+)
+
+
+def _dialect_insert(session: Session):
+    """Return the dialect-specific insert() supporting ON CONFLICT."""
+    if session.get_bind().dialect.name == "postgresql":
+        return pg_insert
+    return sqlite_insert
+
 
 class AssetRepository:
     """Repository class for asset database operations."""
@@ -100,7 +120,7 @@ class AssetRepository:
         session = self._get_session()
 
         try:
-            asset = session.query(Asset).filter_by(symbol=symbol).first()
+            asset = session.scalar(select(Asset).where(Asset.symbol == symbol))
 
             if asset:
                 # Expunge to avoid session issues
@@ -124,7 +144,7 @@ class AssetRepository:
         session = self._get_session()
 
         try:
-            asset = session.query(Asset).filter_by(id=asset_id).first()
+            asset = session.get(Asset, asset_id)
 
             if asset:
                 # Expunge to avoid session issues
@@ -151,15 +171,15 @@ class AssetRepository:
         session = self._get_session()
 
         try:
-            query = session.query(Asset)
+            stmt = select(Asset)
 
             if is_active is not None:
-                query = query.filter(Asset.is_active == is_active)
+                stmt = stmt.where(Asset.is_active == is_active)
 
             if limit:
-                query = query.limit(limit)
+                stmt = stmt.limit(limit)
 
-            assets = query.all()
+            assets = session.scalars(stmt).all()
 
             # Expunge all assets to avoid session issues
             for asset in assets:
@@ -182,6 +202,7 @@ class AssetRepository:
         is_active: Optional[bool] = None,
         asset_metadata: Optional[dict] = None,
         config: Optional[dict] = None,
+        metadata_updates: Optional[dict] = None,
     ) -> Optional[Asset]:
         """Update an existing asset.
 
@@ -195,6 +216,8 @@ class AssetRepository:
             is_active: Whether the asset is active (if updating)
             asset_metadata: Additional metadata (if updating)
             config: Asset-specific configuration (if updating)
+            metadata_updates: Metadata entries merged into the existing
+                metadata within the same transaction (if updating)
 
         Returns:
             Updated Asset object or None if not found
@@ -202,7 +225,7 @@ class AssetRepository:
         session = self._get_session()
 
         try:
-            asset = session.query(Asset).filter_by(symbol=symbol).first()
+            asset = session.scalar(select(Asset).where(Asset.symbol == symbol))
 
             if not asset:
                 return None
@@ -224,6 +247,10 @@ class AssetRepository:
                 asset.asset_metadata = asset_metadata
             if config is not None:
                 asset.config = config
+            if metadata_updates:
+                merged_metadata = dict(asset.asset_metadata or {})
+                merged_metadata.update(metadata_updates)
+                asset.asset_metadata = merged_metadata
 
             session.commit()
             session.refresh(asset)
@@ -255,7 +282,7 @@ class AssetRepository:
         session = self._get_session()
 
         try:
-            asset = session.query(Asset).filter_by(symbol=symbol).first()
+            asset = session.scalar(select(Asset).where(Asset.symbol == symbol))
 
             if not asset:
                 return None
@@ -292,7 +319,7 @@ class AssetRepository:
         session = self._get_session()
 
         try:
-            asset = session.query(Asset).filter_by(symbol=symbol).first()
+            asset = session.scalar(select(Asset).where(Asset.symbol == symbol))
 
             if not asset:
                 return False
@@ -321,8 +348,8 @@ class AssetRepository:
         session = self._get_session()
 
         try:
-            exists = session.query(Asset).filter_by(symbol=symbol).first() is not None
-            return exists
+            stmt = select(Asset.id).where(Asset.symbol == symbol).limit(1)
+            return session.scalar(stmt) is not None
 
         finally:
             if not self.db_session:
@@ -362,44 +389,41 @@ class AssetRepository:
         session = self._get_session()
 
         try:
-            # Try to find existing asset
-            asset = session.query(Asset).filter_by(symbol=symbol).first()
-
-            if asset:
-                # Update existing asset
-                asset.name = name
-                asset.asset_type = asset_type
-                if description is not None:
-                    asset.description = description
-                if sector is not None:
-                    asset.sector = sector
-                if current_price is not None:
-                    asset.current_price = current_price
-                asset.is_active = is_active
-                if asset_metadata is not None:
-                    asset.asset_metadata = asset_metadata
-                if config is not None:
-                    asset.config = config
-            else:
-                # Create new asset
-                asset = Asset(
-                    symbol=symbol,
-                    name=name,
-                    asset_type=asset_type,
-                    description=description,
-                    sector=sector,
-                    current_price=current_price,
-                    is_active=is_active,
-                    asset_metadata=asset_metadata,
-                    config=config,
-                )
-                session.add(asset)
-
-            session.commit()
-            session.refresh(asset)
-
-            # Expunge to avoid session issues
+            values = {
+                "symbol": symbol,
+                "name": name,
+                "asset_type": asset_type,
+                "description": description,
+                "sector": sector,
+                "current_price": current_price,
+                "is_active": is_active,
+                "asset_metadata": asset_metadata,
+                "config": config,
+            }
+            stmt = _dialect_insert(session)(Asset).values(**values)
+
+            # Optional fields only overwrite the stored value when provided
+            update_values = {
+                "name": stmt.excluded.name,
+                "asset_type": stmt.excluded.asset_type,
+                "is_active": stmt.excluded.is_active,
+                "updated_at": func.now(),
+            }
+            for field in _UPSERT_OPTIONAL_FIELDS:
+                if values[field] is not None:
+                    update_values[field] = stmt.excluded[field]
+
+            # Single INSERT ... ON CONFLICT DO UPDATE ... RETURNING round trip
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Asset.symbol], set_=update_values
+            ).returning(Asset)
+            asset = session.scalars(
+                stmt, execution_options={"populate_existing": True}
+            ).one()
+
+            # Expunge before commit so the returned row is not expired
             session.expunge(asset)
+            session.commit()
 
             return asset
 
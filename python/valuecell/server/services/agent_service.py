@@ -2,53 +2,101 @@
 Agent service layer for handling agent-related business logic.
 """
 
+import asyncio
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from valuecell.server.api.schemas.agent import AgentData, AgentListData
 from valuecell.server.db.models.agent import Agent
 
+# How long an unfiltered agent list may be served from memory
+AGENT_LIST_CACHE_TTL_SECONDS = 30.0
+
+# enabled_only -> (cached_at, agent list)
+_agent_list_cache: Dict[bool, Tuple[float, AgentListData]] = {}
+_agent_list_locks: Dict[bool, asyncio.Lock] = {}
+# Bumped on every invalidation so a fill that started before it is not stored
+_agent_list_generation = 0
+
+# Agent list statements built once so SQLAlchemy reuses their compiled form
+_ALL_AGENTS_STMT = select(Agent).order_by(Agent.created_at.desc())
+_ENABLED_AGENTS_STMT = _ALL_AGENTS_STMT.where(Agent.enabled)
+
+
+def _get_cached_agent_list(enabled_only: bool) -> Optional[AgentListData]:
+    """Return the cached agent list if it is still fresh."""
+    cached = _agent_list_cache.get(enabled_only)
+    if cached and time.monotonic() - cached[0] < AGENT_LIST_CACHE_TTL_SECONDS:
+        return cached[1]
+    return None
+
 
 class AgentService:
     """Service class for agent-related operations."""
 
     @staticmethod
-    def get_all_agents(
-        db: Session, enabled_only: bool = False, name_filter: Optional[str] = None
+    def invalidate_agent_cache() -> None:
+        """Drop cached agent lists so the next read hits the database."""
+        global _agent_list_generation
+        _agent_list_generation += 1
+        _agent_list_cache.clear()
+
+    @staticmethod
+    async def get_all_agents(
+        db: AsyncSession, enabled_only: bool = False, name_filter: Optional[str] = None
     ) -> AgentListData:
         """
         Get all agents from database with optional filters.
 
         Args:
-            db: Database session
+            db: Async database session
             enabled_only: Filter only enabled agents
             name_filter: Filter by agent name (partial match)
 
         Returns:
             AgentListData with agents list and statistics
         """
-        # Build query with filters
-        query = db.query(Agent)
+        if name_filter:
+            return await AgentService._query_agents(db, enabled_only, name_filter)
+
+        # Unfiltered listings are served from a short-lived in-process cache
+        cached = _get_cached_agent_list(enabled_only)
+        if cached is not None:
+            return cached
+
+        # Coalesce concurrent misses so only one of them queries the database
+        async with _agent_list_locks.setdefault(enabled_only, asyncio.Lock()):
+            cached = _get_cached_agent_list(enabled_only)
+            if cached is not None:
+                return cached
+            generation = _agent_list_generation
+            agent_list_data = await AgentService._query_agents(db, enabled_only)
+            # An update committed during the query may not be in this result
+            if generation == _agent_list_generation:
+                _agent_list_cache[enabled_only] = (time.monotonic(), agent_list_data)
+            return agent_list_data
 
-        filters = []
-        if enabled_only:
-            filters.append(Agent.enabled)
+    @staticmethod
+    async def _query_agents(
+        db: AsyncSession, enabled_only: bool, name_filter: Optional[str] = None
+    ) -> AgentListData:
+        """Load agents from the database and build the list response."""
+        stmt = _ENABLED_AGENTS_STMT if enabled_only else _ALL_AGENTS_STMT
         if name_filter:
-            filters.append(
+            stmt = stmt.where(
                 or_(
                     Agent.name.ilike(f"%{name_filter}%"),
                     Agent.display_name.ilike(f"%{name_filter}%"),
                 )
             )
 
-        if filters:
-            query = query.filter(and_(*filters))
-
         # Execute query
-        agents = query.order_by(Agent.created_at.desc()).all()
+        result = await db.execute(stmt)
+        agents = result.scalars().all()
 
         # Convert to data models
         agent_data_list = [
@@ -77,18 +125,18 @@ class AgentService:
         )
 
     @staticmethod
-    def get_agent_by_id(db: Session, agent_id: int) -> Optional[AgentData]:
+    async def get_agent_by_id(db: AsyncSession, agent_id: int) -> Optional[AgentData]:
         """
         Get a specific agent by ID.
 
         Args:
-            db: Database session
+            db: Async database session
             agent_id: Agent ID
 
         Returns:
             AgentData if found, None otherwise
         """
-        agent = db.query(Agent).filter(Agent.id == agent_id).first()
+        agent = await db.get(Agent, agent_id)
 
         if not agent:
             return None
@@ -108,32 +156,37 @@ class AgentService:
         )
 
     @staticmethod
-    def update_agent_enabled(
-        db: Session, agent_name: str, enabled: bool
+    async def update_agent_enabled(
+        db: AsyncSession, agent_name: str, enabled: bool
     ) -> Optional[AgentData]:
         """
         Update the enabled status of an agent by name.
 
         Args:
-            db: Database session
+            db: Async database session
             agent_name: Name of the agent to update
             enabled: New enabled status
 
         Returns:
             Updated AgentData if found and updated, None if agent not found
         """
-        agent = db.query(Agent).filter(Agent.name == agent_name).first()
+        # Update the enabled status and timestamp, reading back the row in the
+        # same statement
+        stmt = (
+            update(Agent)
+            .where(Agent.name == agent_name)
+            .values(enabled=enabled, updated_at=datetime.utcnow())
+            .returning(Agent)
+        )
+        agent = await db.scalar(stmt, execution_options={"populate_existing": True})
 
         if not agent:
+            await db.rollback()
             return None
 
-        # Update the enabled status and timestamp
-        agent.enabled = enabled
-        agent.updated_at = datetime.utcnow()
-
         # Commit the changes
-        db.commit()
-        db.refresh(agent)
+        await db.commit()
+        AgentService.invalidate_agent_cache()
 
         return AgentData(
             id=agent.id,
@@ -150,18 +203,20 @@ class AgentService:
         )
 
     @staticmethod
-    def get_agent_by_name(db: Session, agent_name: str) -> Optional[AgentData]:
+    async def get_agent_by_name(
+        db: AsyncSession, agent_name: str
+    ) -> Optional[AgentData]:
         """
         Get a specific agent by name.
 
         Args:
-            db: Database session
+            db: Async database session
             agent_name: Agent name
 
         Returns:
             AgentData if found, None otherwise
         """
-        agent = db.query(Agent).filter(Agent.name == agent_name).first()
+        agent = await db.scalar(select(Agent).where(Agent.name == agent_name))
 
         if not agent:
             return None
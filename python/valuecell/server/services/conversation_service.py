@@ -1,5 +1,6 @@
 """Conversation service for managing conversation data."""
 
+from functools import lru_cache
 from typing import Optional
 
 from valuecell.core.conversation import (
@@ -11,7 +12,11 @@ from valuecell.core.conversation.service import (
     ConversationService as CoreConversationService,
 )
 from valuecell.core.event.factory import ResponseFactory
-from valuecell.core.types import CommonResponseEvent, ComponentType
+from valuecell.core.types import (
+    CommonResponseEvent,
+    ComponentGeneratorResponseDataPayload,
+    ComponentType,
+)
 from valuecell.server.api.schemas.conversation import (
     AgentScheduledTaskResults,
     AllConversationsScheduledTaskData,
@@ -81,21 +86,18 @@ class ConversationService:
         """Convert a BaseResponse to ConversationHistoryItem."""
         data = response.data
 
-        # Convert payload to dict for JSON serialization
+        # Convert payload to dict for JSON serialization; every ResponsePayload
+        # member is a pydantic model, so model_dump is always available
         payload_data = None
         if data.payload:
             try:
-                payload_data = (
-                    data.payload.model_dump()
-                    if hasattr(data.payload, "model_dump")
-                    else str(data.payload)
-                )
+                payload_data = data.payload.model_dump()
             except Exception:
                 payload_data = str(data.payload)
 
         # Normalize event and role names
-        event_str = self._normalize_event_name(str(response.event))
-        role_str = self._normalize_role_name(str(data.role))
+        event_str = _normalize_event_name(str(response.event))
+        role_str = _normalize_role_name(str(data.role))
 
         # Create unified format: event and data at top level
         message_data_with_meta = MessageData(
@@ -114,9 +116,13 @@ class ConversationService:
         return ConversationHistoryItem(event=event_str, data=message_data_with_meta)
 
     async def get_conversation_history(
-        self, conversation_id: str
+        self, conversation_id: str, limit: Optional[int] = None
     ) -> ConversationHistoryData:
-        """Get conversation history for a specific conversation."""
+        """Get conversation history for a specific conversation.
+
+        When `limit` is given only the most recent `limit` stored items are
+        loaded (newest-first in SQL, then put back in chronological order).
+        """
         # Check if conversation exists
         await self._validate_conversation_exists(conversation_id)
 
@@ -124,17 +130,23 @@ class ConversationService:
         conversation_items = (
             await self.core_conversation_service.get_conversation_items(
                 conversation_id=conversation_id,
+                limit=limit,
+                descending=limit is not None,
             )
         )
+        if limit is not None:
+            conversation_items.reverse()
 
         base_responses = []
         for item in conversation_items:
             resp = self.response_factory.from_conversation_item(item)
-            # Exclude scheduled task results from general history
+            # Exclude scheduled task results from general history. A malformed
+            # stored payload falls back to a plain content payload, so check
+            # the type rather than assume a component payload.
             if (
                 resp.event == CommonResponseEvent.COMPONENT_GENERATOR.value
-                and resp.data.payload
-                and getattr(resp.data.payload, "component_type", None)
+                and isinstance(resp.data.payload, ComponentGeneratorResponseDataPayload)
+                and resp.data.payload.component_type
                 == ComponentType.SCHEDULED_TASK_RESULT.value
             ):
                 continue  # Skip scheduled task results in general history
@@ -191,41 +203,27 @@ class ConversationService:
             user_id=user_id
         )
 
+        # Fetch the user's scheduled task results in one filtered query instead
+        # of loading and scanning the full item history of each conversation
+        scheduled_task_items = (
+            await self.core_conversation_service.get_conversation_items(
+                event=CommonResponseEvent.COMPONENT_GENERATOR.value,
+                component_type=ComponentType.SCHEDULED_TASK_RESULT.value,
+                conversation_ids=[conv.conversation_id for conv in conversations],
+            )
+        )
+        items_by_conversation = {}
+        for item in scheduled_task_items:
+            items_by_conversation.setdefault(item.conversation_id, []).append(item)
+
         # Dictionary to group results by agent name and track latest message times
         agent_results = {}
         agent_latest_times = {}
 
         # Process each conversation
         for conversation in conversations:
-            # Get conversation items
-            conversation_items = await self.conversation_manager.get_conversation_items(
-                conversation.conversation_id
-            )
-
-            # Filter for scheduled task results
-            # Note: ConversationItem.payload is a JSON string, not an object
-            scheduled_task_items = []
-            for item in conversation_items:
-                if (
-                    hasattr(item, "event")
-                    and item.event == CommonResponseEvent.COMPONENT_GENERATOR
-                ):
-                    # Parse the payload JSON string to check component_type
-                    try:
-                        import json
-
-                        payload_data = json.loads(item.payload)
-                        if (
-                            payload_data.get("component_type")
-                            == ComponentType.SCHEDULED_TASK_RESULT
-                        ):
-                            scheduled_task_items.append(item)
-                    except (json.JSONDecodeError, AttributeError):
-                        # Skip items with invalid payload
-                        continue
-
             # Convert to history items and group by agent
-            for item in scheduled_task_items:
+            for item in items_by_conversation.get(conversation.conversation_id, []):
                 # Convert ConversationItem to BaseResponse first
                 response = self.response_factory.from_conversation_item(item)
                 history_item = self._convert_response_to_history_item(response)
@@ -275,39 +273,43 @@ class ConversationService:
                 conversation_id=conversation_id, deleted=False
             )
 
-    def _normalize_role_name(self, role: str) -> str:
-        """Normalize role name to match expected format."""
-        role_lower = role.lower()
-        if "user" in role_lower:
-            return "user"
-        elif "agent" in role_lower or "assistant" in role_lower:
-            return "agent"
-        elif "system" in role_lower:
-            return "system"
-        else:
-            return "user"  # Default fallback
-
-    def _normalize_event_name(self, event: str) -> str:
-        """Normalize event name to match expected format."""
-        event_lower = event.lower()
-
-        # Map common event patterns to expected names
-        if "message_chunk" in event_lower or "chunk" in event_lower:
-            return "message_chunk"
-        elif "reasoning" in event_lower:
-            return "reasoning"
-        elif "tool_call_completed" in event_lower or "tool_completed" in event_lower:
-            return "tool_call_completed"
-        elif "component_generator" in event_lower or "component" in event_lower:
-            return "component_generator"
-        elif "thread_started" in event_lower:
-            return "thread_started"
-        elif "task_started" in event_lower:
-            return "task_started"
-        else:
-            # Extract the last part after the last dot or underscore
-            parts = event.replace(".", "_").split("_")
-            return "_".join(parts[-2:]).lower() if len(parts) > 1 else event.lower()
+
+@lru_cache(maxsize=256)
+def _normalize_role_name(role: str) -> str:
+    """Normalize role name to match expected format."""
+    role_lower = role.lower()
+    if "user" in role_lower:
+        return "user"
+    elif "agent" in role_lower or "assistant" in role_lower:
+        return "agent"
+    elif "system" in role_lower:
+        return "system"
+    else:
+        return "user"  # Default fallback
+
+
+@lru_cache(maxsize=256)
+def _normalize_event_name(event: str) -> str:
+    """Normalize event name to match expected format."""
+    event_lower = event.lower()
+
+    # Map common event patterns to expected names
+    if "message_chunk" in event_lower or "chunk" in event_lower:
+        return "message_chunk"
+    elif "reasoning" in event_lower:
+        return "reasoning"
+    elif "tool_call_completed" in event_lower or "tool_completed" in event_lower:
+        return "tool_call_completed"
+    elif "component_generator" in event_lower or "component" in event_lower:
+        return "component_generator"
+    elif "thread_started" in event_lower:
+        return "thread_started"
+    elif "task_started" in event_lower:
+        return "task_started"
+    else:
+        # Extract the last part after the last dot or underscore
+        parts = event.replace(".", "_").split("_")
+        return "_".join(parts[-2:]).lower() if len(parts) > 1 else event.lower()
 
 
 # Global service instance
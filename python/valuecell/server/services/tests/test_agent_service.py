@@ -0,0 +1,147 @@
+"""
+Unit tests for valuecell.server.services.agent_service
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from valuecell.server.api.schemas.agent import AgentListData
+from valuecell.server.db.models.agent import Agent
+from valuecell.server.services import agent_service
+from valuecell.server.services.agent_service import AgentService
+
+
+@pytest.fixture(autouse=True)
+def reset_agent_list_cache():
+    """Isolate the module-level cache and locks between tests."""
+    agent_service._agent_list_cache.clear()
+    agent_service._agent_list_locks.clear()
+    yield
+    agent_service._agent_list_cache.clear()
+    agent_service._agent_list_locks.clear()
+
+
+@asynccontextmanager
+async def agent_session(tmp_path):
+    """Yield an AsyncSession on a fresh SQLite database with two agents."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'agents.db'}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Agent.__table__.create)
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            db.add_all(
+                [
+                    Agent(name="alpha", display_name="Alpha", enabled=True),
+                    Agent(name="beta", display_name="Beta", enabled=False),
+                ]
+            )
+            await db.commit()
+            yield db
+    finally:
+        await engine.dispose()
+
+
+def _agent_list(total: int) -> AgentListData:
+    return AgentListData(agents=[], total=total, enabled_count=0)
+
+
+class TestAgentLookups:
+    """Test single-agent reads and updates on AsyncSession."""
+
+    @pytest.mark.asyncio
+    async def test_get_agent_by_id_and_name(self, tmp_path):
+        async with agent_session(tmp_path) as db:
+            by_name = await AgentService.get_agent_by_name(db, "alpha")
+            by_id = await AgentService.get_agent_by_id(db, by_name.id)
+
+            assert by_id.agent_name == "alpha"
+            assert by_id.display_name == "Alpha"
+            assert await AgentService.get_agent_by_name(db, "missing") is None
+            assert await AgentService.get_agent_by_id(db, 999) is None
+
+    @pytest.mark.asyncio
+    async def test_update_agent_enabled(self, tmp_path):
+        async with agent_session(tmp_path) as db:
+            updated = await AgentService.update_agent_enabled(db, "beta", True)
+
+            assert updated.agent_name == "beta"
+            assert updated.enabled is True
+            assert (await AgentService.get_agent_by_name(db, "beta")).enabled
+            assert await AgentService.update_agent_enabled(db, "missing", True) is None
+
+
+class TestAgentListCache:
+    """Test the TTL cache in front of unfiltered agent listings."""
+
+    @pytest.mark.asyncio
+    async def test_get_all_agents_filters(self, tmp_path):
+        async with agent_session(tmp_path) as db:
+            all_agents = await AgentService.get_all_agents(db)
+            enabled = await AgentService.get_all_agents(db, enabled_only=True)
+            named = await AgentService.get_all_agents(db, name_filter="bet")
+
+            assert (all_agents.total, all_agents.enabled_count) == (2, 1)
+            assert [a.agent_name for a in enabled.agents] == ["alpha"]
+            assert [a.agent_name for a in named.agents] == ["beta"]
+
+    @pytest.mark.asyncio
+    async def test_cached_list_served_until_ttl_expires(self, tmp_path, monkeypatch):
+        async with agent_session(tmp_path) as db:
+            first = await AgentService.get_all_agents(db)
+            db.add(Agent(name="gamma"))
+            await db.commit()
+
+            assert await AgentService.get_all_agents(db) is first
+
+            monkeypatch.setattr(agent_service, "AGENT_LIST_CACHE_TTL_SECONDS", 0)
+            assert (await AgentService.get_all_agents(db)).total == 3
+
+    @pytest.mark.asyncio
+    async def test_update_agent_enabled_invalidates_cache(self, tmp_path):
+        async with agent_session(tmp_path) as db:
+            before = await AgentService.get_all_agents(db, enabled_only=True)
+            await AgentService.update_agent_enabled(db, "beta", True)
+            after = await AgentService.get_all_agents(db, enabled_only=True)
+
+            assert before.total == 1
+            assert {a.agent_name for a in after.agents} == {"alpha", "beta"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_query_once(self, monkeypatch):
+        async def slow_query(db, enabled_only, name_filter=None):
+            await asyncio.sleep(0.01)
+            return _agent_list(total=1)
+
+        query = AsyncMock(side_effect=slow_query)
+        monkeypatch.setattr(AgentService, "_query_agents", query)
+
+        results = await asyncio.gather(
+            *(AgentService.get_all_agents(db=None) for _ in range(5))
+        )
+
+        assert query.await_count == 1
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fill_is_not_overwritten(self, monkeypatch):
+        release = asyncio.Event()
+        results = iter([_agent_list(total=1), _agent_list(total=2)])
+
+        async def query_agents(db, enabled_only, name_filter=None):
+            await release.wait()
+            return next(results)
+
+        monkeypatch.setattr(AgentService, "_query_agents", query_agents)
+
+        # An update commits and invalidates while the first fill is in flight
+        fill = asyncio.create_task(AgentService.get_all_agents(db=None))
+        await asyncio.sleep(0)
+        AgentService.invalidate_agent_cache()
+        release.set()
+
+        assert (await fill).total == 1
+        assert (await AgentService.get_all_agents(db=None)).total == 2